@@ -0,0 +1,253 @@
+"""Streaming alert evaluation for probe results.
+
+Each result is folded into per-target sliding windows that keep running
+sums, so evaluating a rule costs O(1) amortized per event and never
+rescans stored results. Alerts are emitted only on state transitions
+(``firing`` / ``resolved``).
+
+Windows only move forward when events arrive, so ``AlertEvaluator.sweep``
+must be called periodically: it evicts stale events, resolves alerts for
+targets that went quiet and forgets targets whose windows are empty.
+"""
+import asyncio
+import logging
+from collections import deque
+
+
+logger = logging.getLogger(__name__)
+
+
+class SlidingWindow:
+    """Time-based window with running count, failure and latency totals.
+
+    Results replayed after an outage can arrive with timestamps older than
+    ones already seen. A result that is outside the window relative to the
+    newest timestamp is dropped instead of being counted as current.
+    """
+
+    __slots__ = ("seconds", "events", "newest", "count", "failures", "latency_count", "latency_sum")
+
+    def __init__(self, seconds):
+        self.seconds = seconds
+        self.events = deque()
+        self.newest = None
+        self.count = 0
+        self.failures = 0
+        self.latency_count = 0
+        self.latency_sum = 0.0
+
+    def add(self, ts, latency_ms, ok):
+        if self.newest is not None and ts <= self.newest - self.seconds:
+            return False
+        if self.newest is None or ts > self.newest:
+            self.newest = ts
+        self.events.append((ts, latency_ms, ok))
+        self.count += 1
+        if not ok:
+            self.failures += 1
+        if latency_ms is not None:
+            self.latency_count += 1
+            self.latency_sum += latency_ms
+        self.evict(self.newest)
+        return True
+
+    def evict(self, now):
+        cutoff = now - self.seconds
+        events = self.events
+        while events and events[0][0] <= cutoff:
+            _, latency_ms, ok = events.popleft()
+            self.count -= 1
+            if not ok:
+                self.failures -= 1
+            if latency_ms is not None:
+                self.latency_count -= 1
+                self.latency_sum -= latency_ms
+
+    @property
+    def mean_latency(self):
+        return self.latency_sum / self.latency_count if self.latency_count else 0.0
+
+    @property
+    def error_rate(self):
+        return self.failures / self.count if self.count else 0.0
+
+
+class ThresholdRule:
+    """Fires while the mean latency over the window exceeds ``max_latency_ms``."""
+
+    kind = "threshold"
+
+    def __init__(self, name, max_latency_ms, window_seconds=60, min_events=3):
+        self.name = name
+        self.threshold = max_latency_ms
+        self.window_seconds = window_seconds
+        self.min_events = min_events
+        self.windows = {}
+
+    def observe(self, target, ts, latency_ms, ok):
+        window = self.windows.get(target)
+        if window is None:
+            window = self.windows[target] = SlidingWindow(self.window_seconds)
+        window.add(ts, latency_ms, ok)
+        return self._state(window)
+
+    def sweep(self, now):
+        """Yield ``(target, firing, value)`` for every tracked target after eviction."""
+        for target, window in list(self.windows.items()):
+            window.evict(now)
+            if not window.count:
+                del self.windows[target]
+            yield (target, *self._state(window))
+
+    def _state(self, window):
+        value = window.mean_latency
+        return window.latency_count >= self.min_events and value > self.threshold, value
+
+
+class BurnRateRule:
+    """Multi-window error budget burn rate for an availability SLO.
+
+    Fires while both the long and the short window burn the budget at
+    ``burn_rate`` times the sustainable pace or faster.
+    """
+
+    kind = "burn_rate"
+
+    def __init__(self, name, slo_target=0.99, burn_rate=14.4,
+                 long_window_seconds=3600, short_window_seconds=300, min_events=5):
+        if not 0 < slo_target < 1:
+            raise ValueError(f"slo_target must be between 0 and 1 (exclusive), got {slo_target}")
+        self.name = name
+        self.threshold = burn_rate
+        self.budget = 1.0 - slo_target
+        self.long_window_seconds = long_window_seconds
+        self.short_window_seconds = short_window_seconds
+        self.min_events = min_events
+        self.windows = {}
+
+    def observe(self, target, ts, latency_ms, ok):
+        windows = self.windows.get(target)
+        if windows is None:
+            windows = self.windows[target] = (
+                SlidingWindow(self.long_window_seconds),
+                SlidingWindow(self.short_window_seconds),
+            )
+        long_window, short_window = windows
+        long_window.add(ts, latency_ms, ok)
+        short_window.add(ts, latency_ms, ok)
+        return self._state(long_window, short_window)
+
+    def sweep(self, now):
+        """Yield ``(target, firing, value)`` for every tracked target after eviction."""
+        for target, (long_window, short_window) in list(self.windows.items()):
+            long_window.evict(now)
+            short_window.evict(now)
+            if not long_window.count:
+                del self.windows[target]
+            yield (target, *self._state(long_window, short_window))
+
+    def _state(self, long_window, short_window):
+        long_burn = long_window.error_rate / self.budget
+        short_burn = short_window.error_rate / self.budget
+        firing = (
+            long_window.count >= self.min_events
+            and long_burn >= self.threshold
+            and short_burn >= self.threshold
+        )
+        return firing, long_burn
+
+
+class AlertEvaluator:
+    """Runs every rule against each result and reports state transitions.
+
+    Results may reach the evaluator from more than one source (the
+    in-process queue and a change stream), so recently seen result ids
+    are remembered and duplicates are ignored.
+    """
+
+    def __init__(self, rules, max_recent_ids=10000):
+        self.rules = rules
+        self.firing = set()
+        self.latest_timestamp = None
+        self.recent_ids = deque()
+        self.recent_id_set = set()
+        self.max_recent_ids = max_recent_ids
+
+    def _seen(self, result_id):
+        if result_id is None:
+            return False
+        if result_id in self.recent_id_set:
+            return True
+        self.recent_ids.append(result_id)
+        self.recent_id_set.add(result_id)
+        if len(self.recent_ids) > self.max_recent_ids:
+            self.recent_id_set.discard(self.recent_ids.popleft())
+        return False
+
+    def evaluate(self, result):
+        if self._seen(result.get("id")):
+            return []
+        target = result["target"]
+        ts = result["timestamp"].timestamp()
+        if self.latest_timestamp is None or result["timestamp"] > self.latest_timestamp:
+            self.latest_timestamp = result["timestamp"]
+        alerts = []
+        for rule in self.rules:
+            firing, value = rule.observe(target, ts, result.get("latency_ms"), result.get("success", True))
+            # A late (replayed) result must not backdate the alert
+            self._transition(alerts, rule, target, firing, value, self.latest_timestamp)
+        return alerts
+
+    def sweep(self, timestamp):
+        """Evict events older than the rule windows as of ``timestamp``.
+
+        ``timestamp`` must use the same clock as result timestamps (naive UTC).
+        """
+        ts = timestamp.timestamp()
+        alerts = []
+        for rule in self.rules:
+            for target, firing, value in rule.sweep(ts):
+                self._transition(alerts, rule, target, firing, value, timestamp)
+        return alerts
+
+    def _transition(self, alerts, rule, target, firing, value, timestamp):
+        key = (rule.name, target)
+        if firing == (key in self.firing):
+            return
+        if firing:
+            self.firing.add(key)
+        else:
+            self.firing.discard(key)
+        alerts.append({
+            "rule": rule.name,
+            "kind": rule.kind,
+            "target": target,
+            "status": "firing" if firing else "resolved",
+            "value": round(value, 3),
+            "threshold": rule.threshold,
+            "timestamp": timestamp,
+        })
+
+
+class AlertBroadcaster:
+    """Fans alerts out to server-sent event subscribers."""
+
+    def __init__(self, max_pending=100):
+        self.max_pending = max_pending
+        self.subscribers = set()
+
+    def subscribe(self):
+        queue = asyncio.Queue(maxsize=self.max_pending)
+        self.subscribers.add(queue)
+        return queue
+
+    def unsubscribe(self, queue):
+        self.subscribers.discard(queue)
+
+    def publish(self, alert):
+        for queue in self.subscribers:
+            if queue.full():
+                # Slow client: drop its oldest alert instead of blocking the evaluator
+                queue.get_nowait()
+                logger.warning("Dropping alert for slow SSE subscriber")
+            queue.put_nowait(alert)
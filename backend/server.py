@@ -1,15 +1,20 @@
-from fastapi import FastAPI, APIRouter
+from fastapi import FastAPI, APIRouter, Request
+from fastapi.responses import StreamingResponse
 from dotenv import load_dotenv
 from starlette.middleware.cors import CORSMiddleware
 from motor.motor_asyncio import AsyncIOMotorClient
+from pymongo.errors import OperationFailure, PyMongoError
+import asyncio
 import os
 import logging
 from pathlib import Path
 from pydantic import BaseModel, Field
-from typing import List
+from typing import List, Optional
 import uuid
 from datetime import datetime
 
+from alerting import AlertBroadcaster, AlertEvaluator, BurnRateRule, ThresholdRule
+
 
 ROOT_DIR = Path(__file__).parent
 load_dotenv(ROOT_DIR / '.env')
@@ -35,6 +40,51 @@ class StatusCheck(BaseModel):
 class StatusCheckCreate(BaseModel):
     client_name: str
 
+class ProbeResult(BaseModel):
+    id: str = Field(default_factory=lambda: str(uuid.uuid4()))
+    target: str
+    success: bool = True
+    latency_ms: Optional[float] = None
+    status_code: Optional[int] = None
+    timestamp: datetime = Field(default_factory=datetime.utcnow)
+
+class ProbeResultCreate(BaseModel):
+    target: str
+    success: bool = True
+    latency_ms: Optional[float] = None
+    status_code: Optional[int] = None
+
+class Alert(BaseModel):
+    id: str = Field(default_factory=lambda: str(uuid.uuid4()))
+    rule: str
+    kind: str
+    target: str
+    status: str
+    value: float
+    threshold: float
+    timestamp: datetime = Field(default_factory=datetime.utcnow)
+
+# Streaming alert evaluation: results posted to this process arrive through an
+# in-process queue; on a replica set a Mongo change stream also delivers results
+# written by other processes. The evaluator drops duplicates by result id.
+evaluator = AlertEvaluator([
+    ThresholdRule(
+        "high_latency",
+        max_latency_ms=float(os.environ.get('ALERT_LATENCY_MS', '5000')),
+        window_seconds=int(os.environ.get('ALERT_LATENCY_WINDOW_SECONDS', '60')),
+    ),
+    BurnRateRule(
+        "error_budget_burn",
+        slo_target=float(os.environ.get('ALERT_SLO_TARGET', '0.99')),
+        burn_rate=float(os.environ.get('ALERT_BURN_RATE', '14.4')),
+        long_window_seconds=int(os.environ.get('ALERT_BURN_LONG_WINDOW_SECONDS', '3600')),
+        short_window_seconds=int(os.environ.get('ALERT_BURN_SHORT_WINDOW_SECONDS', '300')),
+    ),
+])
+broadcaster = AlertBroadcaster()
+result_queue = asyncio.Queue(maxsize=10000)
+alert_tasks = []
+
 # Add your routes to the router instead of directly to app
 @api_router.get("/")
 async def root():
@@ -52,6 +102,44 @@ async def get_status_checks():
     status_checks = await db.status_checks.find().to_list(1000)
     return [StatusCheck(**status_check) for status_check in status_checks]
 
+@api_router.post("/results", response_model=ProbeResult)
+async def create_probe_result(input: ProbeResultCreate):
+    result_obj = ProbeResult(**input.dict())
+    result_dict = result_obj.dict()
+    _ = await db.probe_results.insert_one(result_dict)
+    try:
+        result_queue.put_nowait(result_dict)
+    except asyncio.QueueFull:
+        logger.warning("Alert queue full, result %s not evaluated", result_obj.id)
+    return result_obj
+
+@api_router.get("/results", response_model=List[ProbeResult])
+async def get_probe_results():
+    probe_results = await db.probe_results.find().to_list(1000)
+    return [ProbeResult(**probe_result) for probe_result in probe_results]
+
+@api_router.get("/alerts", response_model=List[Alert])
+async def get_alerts():
+    alerts = await db.alerts.find().sort("timestamp", -1).to_list(100)
+    return [Alert(**alert) for alert in alerts]
+
+@api_router.get("/alerts/stream")
+async def stream_alerts(request: Request):
+    async def event_source():
+        queue = broadcaster.subscribe()
+        try:
+            while not await request.is_disconnected():
+                try:
+                    alert = await asyncio.wait_for(queue.get(), timeout=15)
+                except asyncio.TimeoutError:
+                    yield ": keep-alive\n\n"
+                    continue
+                yield f"event: alert\ndata: {alert.json()}\n\n"
+        finally:
+            broadcaster.unsubscribe(queue)
+
+    return StreamingResponse(event_source(), media_type="text/event-stream")
+
 # Include the router in the main app
 app.include_router(api_router)
 
@@ -70,6 +158,70 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+async def publish_alerts(alerts):
+    for alert in alerts:
+        alert_obj = Alert(**alert)
+        _ = await db.alerts.insert_one(alert_obj.dict())
+        broadcaster.publish(alert_obj)
+        logger.info("Alert %s: %s on %s (%.3f)", alert_obj.status, alert_obj.rule, alert_obj.target, alert_obj.value)
+
+async def handle_probe_result(result):
+    await publish_alerts(evaluator.evaluate(result))
+
+async def sweep_idle_targets():
+    interval = int(os.environ.get('ALERT_SWEEP_SECONDS', '30'))
+    while True:
+        await asyncio.sleep(interval)
+        try:
+            await publish_alerts(evaluator.sweep(datetime.utcnow()))
+        except Exception:
+            logger.exception("Failed to sweep idle alert targets")
+
+async def consume_result_queue():
+    while True:
+        result = await result_queue.get()
+        try:
+            await handle_probe_result(result)
+        except Exception:
+            logger.exception("Failed to evaluate probe result")
+
+async def watch_probe_results():
+    resume_token = None
+    backoff = 1
+    while True:
+        try:
+            async with db.probe_results.watch(
+                [{"$match": {"operationType": "insert"}}], resume_after=resume_token
+            ) as stream:
+                logger.info("Evaluating alerts from the probe_results change stream")
+                async for change in stream:
+                    resume_token = stream.resume_token
+                    backoff = 1
+                    try:
+                        await handle_probe_result(change["fullDocument"])
+                    except Exception:
+                        logger.exception("Failed to evaluate probe result")
+        except OperationFailure as e:
+            if e.code == 40573:
+                # Standalone server: change streams need a replica set
+                logger.info("Change streams unavailable, using the in-process queue only")
+                return
+            logger.exception("Change stream failed, retrying in %ss", backoff)
+            resume_token = None
+        except PyMongoError:
+            logger.exception("Change stream failed, retrying in %ss", backoff)
+        await asyncio.sleep(backoff)
+        backoff = min(backoff * 2, 60)
+
+@app.on_event("startup")
+async def start_alert_evaluator():
+    alert_tasks.append(asyncio.create_task(consume_result_queue()))
+    alert_tasks.append(asyncio.create_task(sweep_idle_targets()))
+    if os.environ.get('ALERT_CHANGE_STREAM', 'auto') != 'off':
+        alert_tasks.append(asyncio.create_task(watch_probe_results()))
+
 @app.on_event("shutdown")
 async def shutdown_db_client():
+    for task in alert_tasks:
+        task.cancel()
     client.close()
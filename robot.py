@@ -13,22 +13,14 @@ Funcionalidades:
 """
 
 import time
-import logging
-import signal
-import sys
-from datetime import datetime
 from selenium import webdriver
 from selenium.webdriver.chrome.options import Options
-from selenium.webdriver.firefox.options import Options as FirefoxOptions
 from selenium.webdriver.chrome.service import Service
-from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
-from selenium.webdriver.support import expected_conditions as EC
 from selenium.common.exceptions import TimeoutException, WebDriverException
-import subprocess
-import os
+from robot_common import RobotBase
 
-class WebRobot:
+class WebRobot(RobotBase):
     def __init__(self):
         self.driver = None
         self.sites = [
@@ -36,31 +28,13 @@ class WebRobot:
             "https://grupoaronseg.com.br"
         ]
         self.current_site = 0
-        self.cycle_count = 0
-        self.setup_logging()
-        self.setup_signal_handler()
+        super().__init__()
 
-    def setup_logging(self):
-        """Configura o sistema de logs"""
-        logging.basicConfig(
-            level=logging.INFO,
-            format='%(asctime)s - [ROBÔ] - %(levelname)s - %(message)s',
-            datefmt='%Y-%m-%d %H:%M:%S'
-        )
-        self.logger = logging.getLogger(__name__)
-
-    def setup_signal_handler(self):
-        """Configura handler para interrupção graceful com Ctrl+C"""
-        signal.signal(signal.SIGINT, self.signal_handler)
-
-    def signal_handler(self, sig, frame):
-        """Handler para parada graceful"""
-        self.logger.info("🛑 INTERRUPÇÃO RECEBIDA - Parando robô...")
-        self.logger.info(f"📊 TOTAL DE CICLOS EXECUTADOS: {self.cycle_count}")
+    def shutdown(self):
+        """Fecha o navegador ao receber Ctrl+C"""
         if self.driver:
             self.driver.quit()
             self.logger.info("✅ NAVEGADOR FECHADO COM SUCESSO")
-        sys.exit(0)
 
     def setup_driver(self):
         """Configura o driver do Chrome/Firefox em modo headless"""
@@ -125,6 +99,8 @@ class WebRobot:
 
     def install_chromedriver(self):
         """Instala chromedriver automaticamente"""
+        import subprocess
+
         try:
             # Instala chrome se não existir
             subprocess.run(['sudo', 'apt', 'update'], check=True, capture_output=True)
@@ -140,33 +116,40 @@ class WebRobot:
             self.logger.info(f"🌐 ACESSANDO: {url}")
             start_time = time.time()
             
-            self.driver.get(url)
+            with self.profiler.span("navigation"):
+                self.driver.get(url)
             
             # Aguarda página carregar
-            WebDriverWait(self.driver, 10).until(
-                lambda driver: driver.execute_script("return document.readyState") == "complete"
-            )
+            with self.profiler.span("wait"):
+                WebDriverWait(self.driver, 10).until(
+                    lambda driver: driver.execute_script("return document.readyState") == "complete"
+                )
             
             load_time = time.time() - start_time
+            self.report_result(url, True, load_time * 1000)
             self.logger.info(f"✅ SUCESSO! Página carregada em {load_time:.2f} segundos")
             self.logger.info(f"📄 TÍTULO DA PÁGINA: {self.driver.title}")
             
             # Permanece no site por 10 segundos
-            for i in range(10, 0, -1):
-                self.logger.info(f"⏰ Permanecendo no site... {i} segundos restantes")
-                time.sleep(1)
+            with self.profiler.span("dwell"):
+                for i in range(10, 0, -1):
+                    self.logger.info(f"⏰ Permanecendo no site... {i} segundos restantes")
+                    time.sleep(1)
             
             self.logger.info("✅ TEMPO COMPLETADO - Saindo do site")
             return True
             
         except TimeoutException:
             self.logger.error(f"⏰ TIMEOUT: Site {url} demorou muito para carregar")
+            self.report_result(url, False)
             return False
         except WebDriverException as e:
             self.logger.error(f"❌ ERRO DE NAVEGAÇÃO: {e}")
+            self.report_result(url, False)
             return False
         except Exception as e:
             self.logger.error(f"❌ ERRO INESPERADO: {e}")
+            self.report_result(url, False)
             return False
 
     def run_cycle(self):
@@ -185,6 +168,7 @@ class WebRobot:
         else:
             self.logger.warning(f"⚠️  CICLO #{self.cycle_count} completado com erros")
         
+        self.profiler.cycle_done(self.cycle_count, self.driver_pid())
         self.logger.info("⏸️  Pausa de 2 segundos antes do próximo ciclo...")
         time.sleep(2)
 
@@ -199,7 +183,9 @@ class WebRobot:
         self.logger.info("🔁 MODO: Loop infinito (Ctrl+C para parar)")
         self.logger.info("=" * 50)
 
-        if not self.setup_driver():
+        with self.profiler.span("driver_setup"):
+            driver_ready = self.setup_driver()
+        if not driver_ready:
             self.logger.error("❌ Não foi possível configurar o navegador. Saindo...")
             return
 
@@ -213,7 +199,8 @@ class WebRobot:
             self.logger.error(f"❌ ERRO CRÍTICO: {e}")
         finally:
             if self.driver:
-                self.driver.quit()
+                with self.profiler.span("teardown"):
+                    self.driver.quit()
                 self.logger.info("✅ NAVEGADOR FECHADO")
             self.logger.info(f"📊 ROBÔ FINALIZADO - Total de ciclos: {self.cycle_count}")
 
@@ -13,52 +13,27 @@ Funcionalidades:
 """
 
 import time
-import logging
-import signal
-import sys
-from datetime import datetime
 from selenium import webdriver
 from selenium.webdriver.firefox.options import Options as FirefoxOptions
 from selenium.webdriver.firefox.service import Service
-from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
-from selenium.webdriver.support import expected_conditions as EC
 from selenium.common.exceptions import TimeoutException, WebDriverException
-import subprocess
-import os
+from robot_common import RobotBase
 
-class WebRobotBrowser:
+class WebRobotBrowser(RobotBase):
     def __init__(self):
         self.driver = None
         self.site = "https://saude.grupoaronseg.com.br"
-        self.cycle_count = 0
-        self.setup_logging()
-        self.setup_signal_handler()
+        super().__init__()
 
-    def setup_logging(self):
-        """Configura o sistema de logs"""
-        logging.basicConfig(
-            level=logging.INFO,
-            format='%(asctime)s - [ROBÔ] - %(levelname)s - %(message)s',
-            datefmt='%Y-%m-%d %H:%M:%S'
-        )
-        self.logger = logging.getLogger(__name__)
-
-    def setup_signal_handler(self):
-        """Configura handler para interrupção graceful com Ctrl+C"""
-        signal.signal(signal.SIGINT, self.signal_handler)
-
-    def signal_handler(self, sig, frame):
-        """Handler para parada graceful"""
-        self.logger.info("🛑 INTERRUPÇÃO RECEBIDA - Parando robô...")
-        self.logger.info(f"📊 TOTAL DE CICLOS EXECUTADOS: {self.cycle_count}")
+    def shutdown(self):
+        """Fecha o navegador ao receber Ctrl+C"""
         if self.driver:
             try:
                 self.driver.quit()
                 self.logger.info("✅ NAVEGADOR FECHADO COM SUCESSO")
             except:
                 self.logger.warning("⚠️  Erro ao fechar navegador")
-        sys.exit(0)
 
     def setup_driver(self):
         """Configura o driver do Firefox em modo headless"""
@@ -118,14 +93,17 @@ class WebRobotBrowser:
             start_time = time.time()
             
             # Navega para o site (simula digitar a URL)
-            self.driver.get(self.site)
+            with self.profiler.span("navigation"):
+                self.driver.get(self.site)
             
             # Aguarda página carregar
-            WebDriverWait(self.driver, 10).until(
-                lambda driver: driver.execute_script("return document.readyState") == "complete"
-            )
+            with self.profiler.span("wait"):
+                WebDriverWait(self.driver, 10).until(
+                    lambda driver: driver.execute_script("return document.readyState") == "complete"
+                )
             
             load_time = time.time() - start_time
+            self.report_result(self.site, True, load_time * 1000)
             self.logger.info(f"✅ SUCESSO! Página carregada em {load_time:.2f} segundos")
             
             # Obtém informações da página
@@ -139,21 +117,25 @@ class WebRobotBrowser:
             
             # Permanece no site por 20 segundos
             self.logger.info("⏰ PERMANECENDO NO SITE POR 20 SEGUNDOS...")
-            for i in range(20, 0, -1):
-                self.logger.info(f"⏰ {i} segundos restantes...")
-                time.sleep(1)
+            with self.profiler.span("dwell"):
+                for i in range(20, 0, -1):
+                    self.logger.info(f"⏰ {i} segundos restantes...")
+                    time.sleep(1)
             
             self.logger.info("✅ TEMPO COMPLETADO - 20 segundos no site")
             return True
             
         except TimeoutException:
             self.logger.error(f"⏰ TIMEOUT: Site {self.site} demorou muito para carregar")
+            self.report_result(self.site, False)
             return False
         except WebDriverException as e:
             self.logger.error(f"❌ ERRO DE NAVEGAÇÃO: {e}")
+            self.report_result(self.site, False)
             return False
         except Exception as e:
             self.logger.error(f"❌ ERRO INESPERADO: {e}")
+            self.report_result(self.site, False)
             return False
 
     def close_browser(self):
@@ -176,15 +158,21 @@ class WebRobotBrowser:
         self.logger.info("=" * 60)
         
         # Abre navegador
-        if not self.setup_driver():
+        with self.profiler.span("driver_setup"):
+            driver_ready = self.setup_driver()
+        if not driver_ready:
             self.logger.error("❌ Não foi possível abrir o navegador")
             return False
         
         # Visita o site
         success = self.visit_site()
         
+        # Mede a memória antes de fechar, com o navegador ainda vivo
+        self.profiler.cycle_done(self.cycle_count, self.driver_pid())
+        
         # Fecha navegador
-        self.close_browser()
+        with self.profiler.span("teardown"):
+            self.close_browser()
         
         if success:
             self.logger.info(f"✅ CICLO #{self.cycle_count} COMPLETADO COM SUCESSO!")
@@ -0,0 +1,122 @@
+#!/usr/bin/env python3
+"""
+Robô de Navegação Web Automática - Ponto de Entrada Único
+Desenvolvido para Kali Linux
+
+Funcionalidades:
+- Escolhe o motor por flag: http, browser ou pool
+- Importa selenium/requests apenas para o motor escolhido
+- --profile-startup mede tempo de import e de inicialização
+- --profile-* liga o profiling dos ciclos (ver robot_profiling.py)
+
+Motores:
+- http    -> robot_simple.WebRobotSimple (requisições HTTP)
+- browser -> robot_browser.WebRobotBrowser (Firefox aberto/fechado a cada ciclo)
+- pool    -> robot.WebRobot (navegador reaproveitado entre sites e ciclos)
+"""
+
+import argparse
+import importlib
+import time
+from robot_common import configure_logging
+from robot_profiling import Profiler
+
+ENGINES = {
+    "http": ("robot_simple", "WebRobotSimple"),
+    "browser": ("robot_browser", "WebRobotBrowser"),
+    "pool": ("robot", "WebRobot"),
+}
+
+
+def parse_args(argv=None):
+    """Lê os argumentos de linha de comando"""
+    parser = argparse.ArgumentParser(description="Robô de navegação web automática")
+    parser.add_argument(
+        "--engine",
+        choices=sorted(ENGINES),
+        default="http",
+        help="motor de navegação (padrão: http)"
+    )
+    parser.add_argument(
+        "--profile-startup",
+        action="store_true",
+        help="mostra o tempo de import e de inicialização do motor"
+    )
+    parser.add_argument(
+        "--profile-cpu",
+        metavar="ARQUIVO",
+        help="CPU por amostragem em pilhas colapsadas (flamegraph.pl, speedscope)"
+    )
+    parser.add_argument(
+        "--profile-pstats",
+        metavar="ARQUIVO",
+        help="cProfile completo em formato pstats"
+    )
+    parser.add_argument(
+        "--profile-memory",
+        metavar="DIRETÓRIO",
+        help="snapshots do tracemalloc (Snapshot.load) a cada N ciclos"
+    )
+    parser.add_argument(
+        "--profile-memory-every",
+        metavar="N",
+        type=int,
+        default=10,
+        help="intervalo em ciclos entre snapshots de memória (padrão: 10)"
+    )
+    parser.add_argument(
+        "--profile-spans",
+        metavar="ARQUIVO",
+        help="tempo por fase em formato Chrome Trace (chrome://tracing, Perfetto)"
+    )
+    args = parser.parse_args(argv)
+    if args.profile_memory_every < 1:
+        parser.error("--profile-memory-every deve ser >= 1")
+    return args
+
+
+def build_profiler(args):
+    """Monta o profiler a partir das flags --profile-*"""
+    return Profiler(
+        cpu_path=args.profile_cpu,
+        pstats_path=args.profile_pstats,
+        memory_dir=args.profile_memory,
+        memory_every=args.profile_memory_every,
+        spans_path=args.profile_spans
+    )
+
+
+def load_engine(name):
+    """Importa o módulo do motor sob demanda e retorna a classe do robô"""
+    module_name, class_name = ENGINES[name]
+    module = importlib.import_module(module_name)
+    return getattr(module, class_name)
+
+
+def main(argv=None):
+    """Função principal"""
+    args = parse_args(argv)
+
+    import_start = time.perf_counter()
+    robot_class = load_engine(args.engine)
+    import_time = time.perf_counter() - import_start
+
+    init_start = time.perf_counter()
+    robot = robot_class()
+    init_time = time.perf_counter() - init_start
+
+    if args.profile_startup:
+        logger = configure_logging(__name__)
+        logger.info(f"⏱️  STARTUP [{args.engine}]: import {import_time * 1000:.1f} ms, "
+                    f"init {init_time * 1000:.1f} ms, "
+                    f"total {(import_time + init_time) * 1000:.1f} ms")
+
+    robot.profiler = build_profiler(args)
+    robot.profiler.start()
+    try:
+        robot.run()
+    finally:
+        robot.profiler.stop()
+
+if __name__ == "__main__":
+    main()
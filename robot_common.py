@@ -0,0 +1,84 @@
+#!/usr/bin/env python3
+"""
+Base compartilhada pelos robôs de navegação
+
+Funcionalidades:
+- Configuração única do sistema de logs
+- Handler de Ctrl+C/SIGTERM com parada graceful
+- Profiler opcional (desligado por padrão)
+- Envio opcional dos resultados ao backend (ROBOT_REPORT_URL)
+- Sem dependências pesadas (selenium/requests ficam nos motores)
+"""
+
+import json
+import logging
+import os
+import signal
+import sys
+from robot_profiling import Profiler
+
+
+def configure_logging(name):
+    """Configura o sistema de logs e retorna o logger"""
+    logging.basicConfig(
+        level=logging.INFO,
+        format='%(asctime)s - [ROBÔ] - %(levelname)s - %(message)s',
+        datefmt='%Y-%m-%d %H:%M:%S'
+    )
+    return logging.getLogger(name)
+
+
+class RobotBase:
+    """Comportamento comum a todos os motores (logs e interrupção)"""
+
+    def __init__(self):
+        self.cycle_count = 0
+        self.profiler = Profiler()
+        self.report_url = os.environ.get("ROBOT_REPORT_URL")
+        self.setup_logging()
+        self.setup_signal_handler()
+
+    def setup_logging(self):
+        """Configura o sistema de logs"""
+        self.logger = configure_logging(type(self).__module__)
+
+    def setup_signal_handler(self):
+        """Configura handler para interrupção graceful com Ctrl+C ou SIGTERM (docker stop)"""
+        signal.signal(signal.SIGINT, self.signal_handler)
+        signal.signal(signal.SIGTERM, self.signal_handler)
+
+    def signal_handler(self, sig, frame):
+        """Handler para parada graceful"""
+        self.logger.info("🛑 INTERRUPÇÃO RECEBIDA - Parando robô...")
+        self.logger.info(f"📊 TOTAL DE CICLOS EXECUTADOS: {self.cycle_count}")
+        self.shutdown()
+        sys.exit(0)
+
+    def shutdown(self):
+        """Libera recursos do motor (navegador, sessão HTTP...)"""
+
+    def driver_pid(self):
+        """PID do chromedriver/geckodriver, se o motor tiver um em execução"""
+        try:
+            return self.driver.service.process.pid
+        except AttributeError:
+            return None
+
+    def report_result(self, target, success, latency_ms=None, status_code=None):
+        """Envia o resultado da visita para POST /api/results do backend"""
+        if not self.report_url:
+            return
+        import urllib.request
+
+        payload = {"target": target, "success": success, "latency_ms": latency_ms, "status_code": status_code}
+        request = urllib.request.Request(
+            self.report_url,
+            data=json.dumps(payload).encode("utf-8"),
+            headers={"Content-Type": "application/json"},
+            method="POST"
+        )
+        try:
+            with urllib.request.urlopen(request, timeout=5):
+                pass
+        except Exception as e:
+            self.logger.warning(f"⚠️  Falha ao enviar resultado ao backend: {e}")
@@ -0,0 +1,220 @@
+#!/usr/bin/env python3
+"""
+Profiling opcional dos ciclos dos robôs
+
+Funcionalidades:
+- CPU por amostragem (SIGPROF) em formato "collapsed stacks" (flamegraph.pl, speedscope)
+- cProfile completo em arquivo .pstats (pstats, snakeviz)
+- Snapshots do tracemalloc a cada N ciclos, com o crescimento logado
+- RSS do robô e da árvore de processos do driver (chrome/firefox), via /proc
+- Spans por fase (driver_setup, navigation, wait, dwell, teardown) no
+  formato Chrome Trace (chrome://tracing, Perfetto)
+
+Desligado por padrão: sem arquivos configurados, span() e cycle_done()
+não fazem nada.
+"""
+
+import json
+import logging
+import os
+import signal
+import time
+from contextlib import contextmanager, nullcontext
+
+_NULL_SPAN = nullcontext()
+
+
+def read_rss_kib(pid):
+    """VmRSS de um processo em KiB (None se não existir ou sem /proc)"""
+    try:
+        with open(f"/proc/{pid}/status", encoding="utf-8") as status:
+            for line in status:
+                if line.startswith("VmRSS:"):
+                    return int(line.split()[1])
+    except (OSError, ValueError):
+        return None
+    return 0
+
+
+def process_tree(pid):
+    """PIDs do processo e de todos os seus descendentes (Linux /proc)"""
+    children = {}
+    try:
+        entries = os.listdir("/proc")
+    except OSError:
+        return [pid]
+    for entry in entries:
+        if not entry.isdigit():
+            continue
+        try:
+            with open(f"/proc/{entry}/stat", encoding="utf-8") as stat:
+                # O nome do processo pode conter espaços; o PPID vem após o último ")"
+                ppid = int(stat.read().rsplit(")", 1)[1].split()[1])
+        except (OSError, ValueError, IndexError):
+            continue
+        children.setdefault(ppid, []).append(int(entry))
+    tree, pending = [], [pid]
+    while pending:
+        current = pending.pop()
+        tree.append(current)
+        pending.extend(children.get(current, []))
+    return tree
+
+
+def tree_rss_kib(pid):
+    """Soma do RSS da árvore de processos e quantidade de processos vivos"""
+    sizes = [rss for rss in map(read_rss_kib, process_tree(pid)) if rss is not None]
+    return sum(sizes), len(sizes)
+
+
+class SamplingProfiler:
+    """Amostra a pilha da thread principal a cada intervalo de tempo de CPU"""
+
+    def __init__(self, path, interval=0.005):
+        self.path = path
+        self.interval = interval
+        self.stacks = {}
+        self._previous_handler = None
+
+    def _sample(self, sig, frame):
+        """Registra a pilha atual (raiz -> folha) como uma linha colapsada"""
+        names = []
+        while frame is not None:
+            code = frame.f_code
+            names.append(f"{code.co_name} ({os.path.basename(code.co_filename)}:{code.co_firstlineno})")
+            frame = frame.f_back
+        key = ";".join(reversed(names))
+        self.stacks[key] = self.stacks.get(key, 0) + 1
+
+    def start(self):
+        """Liga o timer de CPU (apenas na thread principal)"""
+        self._previous_handler = signal.signal(signal.SIGPROF, self._sample)
+        signal.setitimer(signal.ITIMER_PROF, self.interval, self.interval)
+
+    def stop(self):
+        """Desliga o timer e grava as pilhas colapsadas"""
+        signal.setitimer(signal.ITIMER_PROF, 0, 0)
+        signal.signal(signal.SIGPROF, self._previous_handler or signal.SIG_DFL)
+        with open(self.path, "w", encoding="utf-8") as output:
+            for stack, count in sorted(self.stacks.items()):
+                output.write(f"{stack} {count}\n")
+
+
+class Profiler:
+    """Ponto único de profiling usado pelos robôs"""
+
+    def __init__(self, cpu_path=None, pstats_path=None, memory_dir=None,
+                 memory_every=10, spans_path=None):
+        self.cpu_path = cpu_path
+        self.pstats_path = pstats_path
+        self.memory_dir = memory_dir
+        self.memory_every = memory_every
+        self.spans_path = spans_path
+        self.logger = logging.getLogger(__name__)
+        self._sampler = None
+        self._cprofile = None
+        self._spans = None
+        self._last_snapshot = None
+        self._origin = time.perf_counter()
+
+    @property
+    def enabled(self):
+        return any((self.cpu_path, self.pstats_path, self.memory_dir, self.spans_path))
+
+    def start(self):
+        """Liga os coletores configurados"""
+        if self.spans_path:
+            self._spans = open(self.spans_path, "w", encoding="utf-8")
+            # O formato Chrome Trace aceita o array sem "]" final, então
+            # cada evento é gravado assim que termina.
+            self._spans.write("[\n")
+        if self.memory_dir:
+            import tracemalloc
+
+            os.makedirs(self.memory_dir, exist_ok=True)
+            tracemalloc.start(10)
+        if self.pstats_path:
+            import cProfile
+
+            self._cprofile = cProfile.Profile()
+            self._cprofile.enable()
+        if self.cpu_path:
+            self._sampler = SamplingProfiler(self.cpu_path)
+            self._sampler.start()
+        if self.enabled:
+            self.logger.info("🔬 PROFILING ATIVADO")
+
+    def stop(self):
+        """Desliga os coletores e grava os arquivos pendentes"""
+        if self._sampler:
+            self._sampler.stop()
+            self.logger.info(f"🔬 CPU (amostragem) salvo em {self.cpu_path}")
+            self._sampler = None
+        if self._cprofile:
+            self._cprofile.disable()
+            self._cprofile.dump_stats(self.pstats_path)
+            self.logger.info(f"🔬 PSTATS salvo em {self.pstats_path}")
+            self._cprofile = None
+        if self._spans:
+            self._spans.close()
+            self.logger.info(f"🔬 SPANS salvos em {self.spans_path}")
+            self._spans = None
+        if self.memory_dir:
+            import tracemalloc
+
+            if tracemalloc.is_tracing():
+                tracemalloc.stop()
+
+    def span(self, name):
+        """Cronometra uma fase do ciclo (no-op sem --profile-spans)"""
+        if self._spans is None:
+            return _NULL_SPAN
+        return self._span(name)
+
+    @contextmanager
+    def _span(self, name):
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            end = time.perf_counter()
+            event = {
+                "name": name,
+                "ph": "X",
+                "ts": round((start - self._origin) * 1e6),
+                "dur": round((end - start) * 1e6),
+                "pid": os.getpid(),
+                "tid": 0,
+            }
+            self._spans.write(json.dumps(event) + ",\n")
+            self._spans.flush()
+
+    def cycle_done(self, cycle, driver_pid=None):
+        """Tira um snapshot de memória e mede o RSS a cada N ciclos"""
+        if not self.memory_dir or cycle % self.memory_every:
+            return
+        self.log_rss(cycle, driver_pid)
+        import tracemalloc
+
+        snapshot = tracemalloc.take_snapshot()
+        path = os.path.join(self.memory_dir, f"cycle_{cycle:06d}.tracemalloc")
+        snapshot.dump(path)
+        current, peak = tracemalloc.get_traced_memory()
+        self.logger.info(f"🔬 MEMÓRIA CICLO #{cycle}: atual {current / 1024:.0f} KiB, "
+                         f"pico {peak / 1024:.0f} KiB ({path})")
+        if self._last_snapshot is not None:
+            for stat in snapshot.compare_to(self._last_snapshot, "lineno")[:5]:
+                if stat.size_diff > 0:
+                    self.logger.info(f"🔬   +{stat.size_diff / 1024:.1f} KiB {stat.traceback}")
+        self._last_snapshot = snapshot
+
+    def log_rss(self, cycle, driver_pid=None):
+        """Loga o RSS do robô e da árvore do driver, que o tracemalloc não enxerga"""
+        robot_rss = read_rss_kib(os.getpid())
+        if robot_rss is None:
+            return
+        message = f"🔬 RSS CICLO #{cycle}: robô {robot_rss / 1024:.1f} MiB"
+        if driver_pid:
+            driver_rss, processes = tree_rss_kib(driver_pid)
+            message += f", driver+navegador {driver_rss / 1024:.1f} MiB ({processes} processos)"
+        self.logger.info(message)
@@ -13,43 +13,21 @@ Funcionalidades:
 """
 
 import time
-import logging
-import signal
-import sys
 import requests
-from datetime import datetime
-from urllib.parse import urljoin
+from robot_common import RobotBase
 
-class WebRobotSimple:
+class WebRobotSimple(RobotBase):
     def __init__(self):
         self.site = "https://saude.grupoaronseg.com.br"
-        self.cycle_count = 0
         self.session = None
-        self.setup_logging()
-        self.setup_signal_handler()
+        super().__init__()
         self.setup_session()
 
-    def setup_logging(self):
-        """Configura o sistema de logs"""
-        logging.basicConfig(
-            level=logging.INFO,
-            format='%(asctime)s - [ROBÔ] - %(levelname)s - %(message)s',
-            datefmt='%Y-%m-%d %H:%M:%S'
-        )
-        self.logger = logging.getLogger(__name__)
-
-    def setup_signal_handler(self):
-        """Configura handler para interrupção graceful com Ctrl+C"""
-        signal.signal(signal.SIGINT, self.signal_handler)
-
-    def signal_handler(self, sig, frame):
-        """Handler para parada graceful"""
-        self.logger.info("🛑 INTERRUPÇÃO RECEBIDA - Parando robô...")
-        self.logger.info(f"📊 TOTAL DE CICLOS EXECUTADOS: {self.cycle_count}")
+    def shutdown(self):
+        """Fecha a sessão HTTP ao receber Ctrl+C"""
         if self.session:
             self.session.close()
             self.logger.info("✅ SESSÃO HTTP FECHADA COM SUCESSO")
-        sys.exit(0)
 
     def setup_session(self):
         """Configura sessão HTTP com headers realistas"""
@@ -81,9 +59,11 @@ class WebRobotSimple:
             start_time = time.time()
             
             # Faz a requisição HTTP
-            response = self.session.get(url)
+            with self.profiler.span("navigation"):
+                response = self.session.get(url)
             
             load_time = time.time() - start_time
+            self.report_result(url, response.status_code == 200, load_time * 1000, response.status_code)
             
             if response.status_code == 200:
                 self.logger.info(f"✅ SUCESSO! Site carregado em {load_time:.2f} segundos")
@@ -107,24 +87,29 @@ class WebRobotSimple:
             
             # Permanece "navegando" por 20 segundos
             self.logger.info("⏰ PERMANECENDO NO SITE POR 20 SEGUNDOS...")
-            for i in range(20, 0, -1):
-                self.logger.info(f"⏰ {i} segundos restantes...")
-                time.sleep(1)
+            with self.profiler.span("dwell"):
+                for i in range(20, 0, -1):
+                    self.logger.info(f"⏰ {i} segundos restantes...")
+                    time.sleep(1)
             
             self.logger.info("✅ TEMPO COMPLETADO - 20 segundos no site")
             return True
             
         except requests.exceptions.Timeout:
             self.logger.error(f"⏰ TIMEOUT: Site {url} demorou mais que 30 segundos")
+            self.report_result(url, False)
             return False
         except requests.exceptions.ConnectionError as e:
             self.logger.error(f"🌐 ERRO DE CONEXÃO: {e}")
+            self.report_result(url, False)
             return False
         except requests.exceptions.RequestException as e:
             self.logger.error(f"❌ ERRO DE REQUISIÇÃO: {e}")
+            self.report_result(url, False)
             return False
         except Exception as e:
             self.logger.error(f"❌ ERRO INESPERADO: {e}")
+            self.report_result(url, False)
             return False
 
     def run_cycle(self):
@@ -141,6 +126,7 @@ class WebRobotSimple:
         else:
             self.logger.warning(f"⚠️  CICLO #{self.cycle_count} completado com erros")
         
+        self.profiler.cycle_done(self.cycle_count)
         self.logger.info("⏸️  Pausa de 3 segundos antes do próximo ciclo...")
         time.sleep(3)
 
@@ -16,4 +16,4 @@ echo "==============================="
 cd /app
 
 # Executa o robô
-python3 robot_simple.py
\ No newline at end of file
+python3 robot_cli.py --engine http
\ No newline at end of file
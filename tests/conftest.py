@@ -0,0 +1,70 @@
+import signal
+import sys
+import types
+
+import pytest
+
+
+ROBOT_MODULES = ("robot", "robot_browser", "robot_simple")
+
+
+def _module(monkeypatch, name, **attrs):
+    module = types.ModuleType(name)
+    for attr, value in attrs.items():
+        setattr(module, attr, value)
+    monkeypatch.setitem(sys.modules, name, module)
+    return module
+
+
+@pytest.fixture(autouse=True)
+def fresh_robot_modules(monkeypatch):
+    """Force every test to import the robot modules against its own stubs."""
+    for name in ROBOT_MODULES:
+        monkeypatch.delitem(sys.modules, name, raising=False)
+
+
+@pytest.fixture
+def no_signal_handlers(monkeypatch):
+    """Keep RobotBase from replacing pytest's own signal handlers."""
+    installed = {}
+    monkeypatch.setattr(signal, "signal", lambda sig, handler: installed.__setitem__(sig, handler))
+    return installed
+
+
+@pytest.fixture
+def stub_requests(monkeypatch):
+    class RequestException(Exception):
+        pass
+
+    class Timeout(RequestException):
+        pass
+
+    class ConnectionError(RequestException):
+        pass
+
+    exceptions = _module(monkeypatch, "requests.exceptions", RequestException=RequestException,
+                         Timeout=Timeout, ConnectionError=ConnectionError)
+    return _module(monkeypatch, "requests", exceptions=exceptions, Session=lambda: types.SimpleNamespace(
+        headers={}, close=lambda: None))
+
+
+@pytest.fixture
+def stub_selenium(monkeypatch):
+    class WebDriverException(Exception):
+        pass
+
+    class TimeoutException(WebDriverException):
+        pass
+
+    webdriver = _module(monkeypatch, "selenium.webdriver")
+    _module(monkeypatch, "selenium", webdriver=webdriver)
+    for browser in ("chrome", "firefox"):
+        _module(monkeypatch, f"selenium.webdriver.{browser}")
+        _module(monkeypatch, f"selenium.webdriver.{browser}.options", Options=object)
+        _module(monkeypatch, f"selenium.webdriver.{browser}.service", Service=object)
+    _module(monkeypatch, "selenium.webdriver.support")
+    _module(monkeypatch, "selenium.webdriver.support.ui", WebDriverWait=object)
+    _module(monkeypatch, "selenium.common")
+    _module(monkeypatch, "selenium.common.exceptions", WebDriverException=WebDriverException,
+            TimeoutException=TimeoutException)
+    return webdriver
@@ -0,0 +1,145 @@
+import sys
+from datetime import datetime, timedelta
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "backend"))
+
+from alerting import AlertEvaluator, BurnRateRule, SlidingWindow, ThresholdRule  # noqa: E402
+
+
+T0 = datetime(2026, 1, 1)
+
+
+def result(seconds, latency_ms=100.0, success=True, target="site", result_id=None):
+    return {
+        "id": result_id,
+        "target": target,
+        "timestamp": T0 + timedelta(seconds=seconds),
+        "latency_ms": latency_ms,
+        "success": success,
+    }
+
+
+def test_sliding_window_evicts_events_at_cutoff():
+    window = SlidingWindow(10)
+    window.add(0, 100.0, True)
+    window.add(5, 300.0, False)
+    assert (window.count, window.failures, window.mean_latency) == (2, 1, 200.0)
+
+    window.evict(9.999)
+    assert window.count == 2
+
+    # An event exactly `seconds` old falls out of the window
+    window.evict(10)
+    assert (window.count, window.failures, window.mean_latency) == (1, 1, 300.0)
+
+    window.evict(15)
+    assert (window.count, window.failures, window.mean_latency, window.error_rate) == (0, 0, 0.0, 0.0)
+
+
+def test_threshold_rule_waits_for_min_events():
+    rule = ThresholdRule("latency", max_latency_ms=1000, window_seconds=60, min_events=3)
+    assert rule.observe("site", 0, 5000.0, True) == (False, 5000.0)
+    assert rule.observe("site", 1, 5000.0, True) == (False, 5000.0)
+    assert rule.observe("site", 2, 5000.0, True) == (True, 5000.0)
+
+
+def test_threshold_alert_fires_then_resolves():
+    evaluator = AlertEvaluator([ThresholdRule("latency", max_latency_ms=1000, window_seconds=60, min_events=2)])
+    statuses = []
+    for second, latency in enumerate([2000, 2000, 2000, 100, 100, 100, 100]):
+        statuses += [alert["status"] for alert in evaluator.evaluate(result(second, latency))]
+    assert statuses == ["firing", "resolved"]
+
+
+def test_alert_evaluator_emits_only_transitions():
+    evaluator = AlertEvaluator([ThresholdRule("latency", max_latency_ms=1000, min_events=1)])
+    alerts = [evaluator.evaluate(result(second, 5000.0)) for second in range(5)]
+    assert [len(batch) for batch in alerts] == [1, 0, 0, 0, 0]
+    assert alerts[0][0]["status"] == "firing"
+    assert evaluator.firing == {("latency", "site")}
+
+
+def test_alert_evaluator_ignores_duplicate_result_ids():
+    evaluator = AlertEvaluator([ThresholdRule("latency", max_latency_ms=1000, min_events=2)])
+    assert evaluator.evaluate(result(0, 5000.0, result_id="a")) == []
+    assert evaluator.evaluate(result(0, 5000.0, result_id="a")) == []
+    assert evaluator.rules[0].windows["site"].count == 1
+
+
+def test_burn_rate_requires_both_windows():
+    def make_rule():
+        return BurnRateRule("burn", slo_target=0.9, burn_rate=2, long_window_seconds=100,
+                            short_window_seconds=10, min_events=1)
+
+    # Burst of failures: both windows burning
+    rule = make_rule()
+    for second in range(6):
+        firing, _ = rule.observe("site", second, None, False)
+    assert firing
+
+    # Short window recovers while the long window still holds the failures
+    for second in range(20, 35):
+        firing, long_burn = rule.observe("site", second, None, True)
+    assert long_burn >= 2
+    assert not firing
+
+    # Short window burning alone is not enough either
+    rule = make_rule()
+    for second in range(78):
+        rule.observe("site", second, None, True)
+    for second in range(78, 81):
+        firing, long_burn = rule.observe("site", second, None, False)
+    assert long_burn < 2
+    assert not firing
+
+
+@pytest.mark.parametrize("slo_target", [0, 1, 1.5, -0.1])
+def test_burn_rate_rejects_invalid_slo(slo_target):
+    with pytest.raises(ValueError):
+        BurnRateRule("burn", slo_target=slo_target)
+
+
+def test_sweep_resolves_and_forgets_idle_targets():
+    evaluator = AlertEvaluator([ThresholdRule("latency", max_latency_ms=1000, window_seconds=60, min_events=1)])
+    assert evaluator.evaluate(result(0, 5000.0))[0]["status"] == "firing"
+
+    assert evaluator.sweep(T0 + timedelta(seconds=30)) == []
+
+    alerts = evaluator.sweep(T0 + timedelta(seconds=60))
+    assert [alert["status"] for alert in alerts] == ["resolved"]
+    assert evaluator.rules[0].windows == {}
+    assert evaluator.firing == set()
+
+
+def test_sliding_window_drops_results_older_than_the_window():
+    window = SlidingWindow(10)
+    window.add(100, 100.0, True)
+    assert window.add(90, 100.0, False) is False
+    assert window.add(95, 300.0, False) is True
+    assert (window.count, window.failures, window.newest) == (2, 1, 100)
+
+
+def test_burn_rate_ignores_replayed_results_outside_the_short_window():
+    rule = BurnRateRule("burn", slo_target=0.9, burn_rate=2, long_window_seconds=3600,
+                        short_window_seconds=300, min_events=5)
+    for ts in range(1000, 1600, 10):
+        rule.observe("site", ts, None, True)
+    # Failures replayed from a resumed change stream, long before the newest result
+    for ts in range(400, 460, 5):
+        firing, _ = rule.observe("site", ts, None, False)
+
+    long_window, short_window = rule.windows["site"]
+    assert (long_window.count, long_window.failures) == (72, 12)
+    assert (short_window.count, short_window.failures) == (30, 0)
+    assert not firing
+
+
+def test_alerts_from_late_results_are_not_backdated():
+    evaluator = AlertEvaluator([ThresholdRule("latency", max_latency_ms=1000, window_seconds=60, min_events=2)])
+    evaluator.evaluate(result(50, 5000.0))
+    alerts = evaluator.evaluate(result(30, 5000.0))
+    assert [alert["status"] for alert in alerts] == ["firing"]
+    assert alerts[0]["timestamp"] == T0 + timedelta(seconds=50)
@@ -0,0 +1,94 @@
+import json
+import os
+import subprocess
+import sys
+import time
+import tracemalloc
+
+import pytest
+
+import robot_profiling
+from robot_profiling import Profiler, SamplingProfiler
+
+
+def test_span_is_shared_noop_when_disabled():
+    profiler = Profiler()
+    profiler.start()
+    try:
+        assert profiler.span("navigation") is robot_profiling._NULL_SPAN
+        with profiler.span("navigation"):
+            pass
+    finally:
+        profiler.stop()
+
+
+def test_spans_file_is_chrome_trace_json(tmp_path):
+    path = tmp_path / "spans.json"
+    profiler = Profiler(spans_path=str(path))
+    profiler.start()
+    with profiler.span("driver_setup"):
+        pass
+    with profiler.span("navigation"):
+        pass
+    profiler.stop()
+
+    # The array is left open on purpose; closing it must give valid JSON
+    text = path.read_text(encoding="utf-8").rstrip().rstrip(",") + "]"
+    events = json.loads(text)
+    assert [event["name"] for event in events] == ["driver_setup", "navigation"]
+    for event in events:
+        assert event["ph"] == "X"
+        assert event["dur"] >= 0
+        assert event["pid"] == os.getpid()
+
+
+def test_cycle_done_snapshots_every_n_cycles(tmp_path):
+    memory_dir = tmp_path / "mem"
+    profiler = Profiler(memory_dir=str(memory_dir), memory_every=3)
+    profiler.start()
+    try:
+        for cycle in range(1, 8):
+            profiler.cycle_done(cycle)
+    finally:
+        profiler.stop()
+
+    snapshots = sorted(os.listdir(memory_dir))
+    assert snapshots == ["cycle_000003.tracemalloc", "cycle_000006.tracemalloc"]
+    snapshot = tracemalloc.Snapshot.load(str(memory_dir / snapshots[0]))
+    assert isinstance(snapshot, tracemalloc.Snapshot)
+
+
+def test_cycle_done_logs_driver_tree_rss(tmp_path, caplog):
+    if not os.path.exists("/proc/self/status"):
+        pytest.skip("requires /proc")
+    child = subprocess.Popen([sys.executable, "-c", "import time; time.sleep(30)"])
+    profiler = Profiler(memory_dir=str(tmp_path), memory_every=1)
+    profiler.start()
+    try:
+        with caplog.at_level("INFO", logger="robot_profiling"):
+            profiler.cycle_done(1, driver_pid=child.pid)
+    finally:
+        profiler.stop()
+        child.kill()
+        child.wait()
+
+    assert "RSS CICLO #1: robô" in caplog.text
+    assert "driver+navegador" in caplog.text
+    assert "(1 processos)" in caplog.text
+
+
+def test_sampling_profiler_writes_collapsed_stacks(tmp_path):
+    path = tmp_path / "cpu.folded"
+    sampler = SamplingProfiler(str(path), interval=0.001)
+    sampler.start()
+    deadline = time.process_time() + 2
+    while not sampler.stacks and time.process_time() < deadline:
+        sum(i * i for i in range(1000))
+    sampler.stop()
+
+    lines = path.read_text(encoding="utf-8").splitlines()
+    assert lines
+    for line in lines:
+        stack, count = line.rsplit(" ", 1)
+        assert int(count) >= 1
+        assert "test_sampling_profiler_writes_collapsed_stacks" in stack
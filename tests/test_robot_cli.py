@@ -0,0 +1,39 @@
+import sys
+
+import pytest
+
+import robot_cli
+
+
+def test_http_engine_does_not_import_selenium(stub_requests, monkeypatch):
+    for name in list(sys.modules):
+        if name.split(".")[0] in ("selenium", "webdriver_manager"):
+            monkeypatch.delitem(sys.modules, name)
+
+    robot_class = robot_cli.load_engine("http")
+
+    assert robot_class.__name__ == "WebRobotSimple"
+    assert not any(name.split(".")[0] in ("selenium", "webdriver_manager") for name in sys.modules)
+
+
+@pytest.mark.parametrize("engine", ["http", "browser", "pool"])
+def test_parse_args_accepts_known_engines(engine):
+    assert robot_cli.parse_args(["--engine", engine]).engine == engine
+
+
+def test_parse_args_defaults():
+    args = robot_cli.parse_args([])
+    assert args.engine == "http"
+    assert args.profile_memory_every == 10
+    assert not args.profile_startup
+
+
+@pytest.mark.parametrize("argv", [
+    ["--engine", "chrome"],
+    ["--profile-memory-every", "0"],
+    ["--profile-memory-every", "-3"],
+])
+def test_parse_args_rejects_invalid_values(argv, capsys):
+    with pytest.raises(SystemExit) as exc_info:
+        robot_cli.parse_args(argv)
+    assert exc_info.value.code == 2
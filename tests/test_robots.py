@@ -0,0 +1,59 @@
+import importlib
+import signal
+import types
+
+import pytest
+
+from robot_common import RobotBase
+
+
+class CrashedDriver:
+    """Driver whose chromedriver/geckodriver process is gone."""
+
+    def get(self, url):
+        raise ConnectionRefusedError("[Errno 111] Connection refused")
+
+
+def _record_reports(robot):
+    reports = []
+    robot.report_result = lambda target, success, *args: reports.append((target, success))
+    return reports
+
+
+@pytest.mark.parametrize("module_name, class_name", [
+    ("robot", "WebRobot"),
+    ("robot_browser", "WebRobotBrowser"),
+])
+def test_browser_robots_report_non_webdriver_failures(stub_selenium, no_signal_handlers, module_name, class_name):
+    robot_class = getattr(importlib.import_module(module_name), class_name)
+    robot = robot_class()
+    robot.driver = CrashedDriver()
+    reports = _record_reports(robot)
+
+    url = "https://saude.grupoaronseg.com.br"
+    visited = robot.visit_site(url) if module_name == "robot" else robot.visit_site()
+
+    assert visited is False
+    assert reports == [(url, False)]
+
+
+def test_http_robot_reports_unexpected_failures(stub_requests, no_signal_handlers, monkeypatch):
+    robot_simple = importlib.import_module("robot_simple")
+    monkeypatch.setattr(robot_simple.time, "sleep", lambda seconds: None)
+    robot = robot_simple.WebRobotSimple()
+
+    def get(url):
+        raise ValueError("corrupted response")
+
+    robot.session = types.SimpleNamespace(get=get, close=lambda: None)
+    reports = _record_reports(robot)
+
+    assert robot.visit_site(robot.site) is False
+    assert reports == [(robot.site, False)]
+
+
+def test_robots_stop_gracefully_on_sigint_and_sigterm(no_signal_handlers):
+    robot = RobotBase()
+    assert no_signal_handlers == {signal.SIGINT: robot.signal_handler, signal.SIGTERM: robot.signal_handler}
+    with pytest.raises(SystemExit):
+        robot.signal_handler(signal.SIGTERM, None)